@@ -6,5 +6,10 @@ DB_PORT = int(os.getenv("DB_PORT", "5432"))
 DB_NAME = os.getenv("DB_NAME", "postgres")
 DB_USER = os.getenv("DB_USER", "postgres")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "")
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "10"))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "20"))
 CACHE_TTL_HOURS = int(os.getenv("CACHE_TTL_HOURS", "24"))
 REQUEST_DELAY = float(os.getenv("REQUEST_DELAY", "2.5"))
+MEMORY_CACHE_SIZE = int(os.getenv("MEMORY_CACHE_SIZE", "10000"))
+PARSER_CACHE_TTL = float(os.getenv("PARSER_CACHE_TTL", "300"))
+PARSER_CACHE_SIZE = int(os.getenv("PARSER_CACHE_SIZE", "4096"))
@@ -1,18 +1,52 @@
 import json
 import logging
-from datetime import datetime, timedelta, timezone
+import asyncio
+import itertools
+import operator
+import time
+from collections import OrderedDict
+from datetime import timezone
 
 import asyncpg
 
-from app.config import DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD, CACHE_TTL_HOURS
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from app.config import (
+    DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD, DB_POOL_MIN, DB_POOL_MAX,
+    CACHE_TTL_HOURS, MEMORY_CACHE_SIZE,
+)
 from app.models import Company, StatsResponse
 
 logger = logging.getLogger(__name__)
 
 _pool: asyncpg.Pool | None = None
+# Shared pool-creation + migration task; callers await it through a shield so a
+# cancelled caller (e.g. a losing cache probe) can't abort initialization halfway
+_pool_init: asyncio.Task | None = None
+
+# In-process LRU in front of PostgreSQL: key -> (expires_at monotonic ns, Company).
+# Keys are "inn:<inn>" / "ogrn:<ogrn>". Only touched from the event loop without
+# awaits between read and write, so no lock is needed.
+_mem: OrderedDict[str, tuple[int, Company]] = OrderedDict()
+# Per-key write generation, bumped after each committed save. A probe only fills
+# _mem if the generation it saw before querying is still current, so a row read
+# before a save commits is never put back afterwards. Evicted keys report the
+# highest evicted generation, which can only make a probe skip its put.
+_write_seq = itertools.count(1)
+_mem_gen: OrderedDict[str, int] = OrderedDict()
+_mem_gen_floor: int = 0
+_TTL_SECONDS: float = CACHE_TTL_HOURS * 3600
+
+# /stats result is recomputed at most once per _STATS_TTL_SECONDS
+_STATS_TTL_SECONDS = 60
+_stats_cache: StatsResponse | None = None
+_stats_cache_until: float = 0
 
 # All columns in the organizations table (order matters for save)
-COLUMNS = [
+COLUMNS = (
     "inn", "kpp", "ogrn", "name", "full_name", "status", "address", "region",
     "ceo_name", "ceo_title", "okved_code", "okved_name", "okpo", "oktmo",
     "okato", "okfs", "okogu", "capital", "registration_date", "url",
@@ -29,10 +63,40 @@ COLUMNS = [
     "enforcement_count", "enforcement_sum",
     "taxes_sum", "taxes_year", "contributions_sum",
     "sections",
-]
+)
 
 # Columns stored as JSONB in PostgreSQL
-JSONB_COLUMNS = {"founders", "sections"}
+JSONB_COLUMNS = frozenset({"founders", "sections"})
+
+# Explicit projection: only the columns _row_to_company reads. COLUMNS come first,
+# so records can be unpacked positionally.
+SELECT_COLS = ", ".join(
+    (*COLUMNS, "updated_at", "EXTRACT(EPOCH FROM updated_at) AS updated_epoch")
+)
+_UPDATED_AT_IDX = len(COLUMNS)
+
+# Hot cache-probe queries, prepared once per connection via the statement cache.
+# Stale rows are filtered server-side: $2 is CACHE_TTL_HOURS.
+_SQL_BY_INN = (
+    f"SELECT {SELECT_COLS} FROM organizations "
+    "WHERE inn = $1 AND updated_at > NOW() - make_interval(hours => $2)"
+)
+_SQL_BY_OGRN = (
+    f"SELECT {SELECT_COLS} FROM organizations "
+    "WHERE ogrn = $1 AND updated_at > NOW() - make_interval(hours => $2)"
+)
+
+# Upsert statement, a pure function of COLUMNS, built once at import
+_INSERT_SQL = f"""
+    INSERT INTO organizations ({", ".join(COLUMNS)}, created_at, updated_at)
+    VALUES ({", ".join(f"${i+1}" for i in range(len(COLUMNS)))}, NOW(), NOW())
+    ON CONFLICT (inn) DO UPDATE SET
+        {", ".join(f"{col} = EXCLUDED.{col}" for col in COLUMNS if col != "inn")},
+        updated_at = NOW()
+"""
+
+# Company -> tuple of COLUMNS values, in a single C-level call
+_pack_values = operator.attrgetter(*COLUMNS)
 
 # Column type mapping for auto-migration
 COLUMN_TYPES = {
@@ -68,45 +132,183 @@ COLUMN_TYPES = {
     "sections": "JSONB",
 }
 
+# Indexes for cache probes, created by auto-migration (inn is covered by the primary key)
+INDEXES = {
+    "organizations_ogrn_idx": "ON organizations (ogrn) WHERE ogrn IS NOT NULL",
+}
+# Indexes created by earlier versions that are no longer wanted
+OBSOLETE_INDEXES = ("organizations_inn_updated_idx",)
+
+_SQL_INDEX_INVALID = "SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass($1::text)"
+# An index being built CONCURRENTLY is also not yet valid; don't drop those
+_SQL_INDEX_BUILDING = (
+    "SELECT EXISTS (SELECT 1 FROM pg_stat_progress_create_index"
+    " WHERE index_relid = to_regclass($1::text))"
+)
+# Session-level advisory lock so only one worker/process migrates indexes at a time
+_SQL_INDEX_LOCK = "SELECT pg_try_advisory_lock(hashtext('organizations_index_migration'))"
+
 
 _migrated: bool = False
+_index_task: asyncio.Task | None = None
+
+
+# jsonb binary wire format: 1-byte version (always 1) followed by the JSON text
+_JSONB_VERSION = b"\x01"
+
+
+def _jsonb_encode(value) -> bytes:
+    if orjson is not None:
+        return _JSONB_VERSION + orjson.dumps(value)
+    return _JSONB_VERSION + json.dumps(value, ensure_ascii=False).encode()
+
+
+def _jsonb_decode(data: bytes):
+    # memoryview slice skips the version byte without copying the payload
+    if orjson is not None:
+        return orjson.loads(memoryview(data)[1:])
+    return json.loads(data[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Register binary JSONB codec so founders/sections arrive as native lists/dicts."""
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_jsonb_encode,
+        decoder=_jsonb_decode,
+        schema="pg_catalog",
+        format="binary",
+    )
 
 
 async def _ensure_pool() -> asyncpg.Pool | None:
     """Lazy pool initialization with retry on each call. Runs migration on first connect."""
-    global _pool, _migrated
+    global _pool_init
     if _pool:
         return _pool
+    if _pool_init is None:
+        _pool_init = asyncio.create_task(_create_pool())
+    task = _pool_init
     try:
-        _pool = await asyncpg.create_pool(
+        return await asyncio.shield(task)
+    finally:
+        # A finished attempt is forgotten so the next call can retry after a failure
+        if task.done() and _pool_init is task:
+            _pool_init = None
+
+
+async def _create_pool() -> asyncpg.Pool | None:
+    """Create the pool and migrate; _pool is only published once both succeed."""
+    global _pool, _migrated
+    pool = None
+    try:
+        pool = await asyncpg.create_pool(
             host=DB_HOST,
             port=DB_PORT,
             database=DB_NAME,
             user=DB_USER,
             password=DB_PASSWORD,
-            min_size=1,
-            max_size=5,
+            min_size=DB_POOL_MIN,
+            max_size=DB_POOL_MAX,
+            max_inactive_connection_lifetime=300,
+            command_timeout=5,
+            init=_init_connection,
+            statement_cache_size=1024,
         )
         logger.info("Database pool created: %s@%s:%s/%s", DB_USER, DB_HOST, DB_PORT, DB_NAME)
         if not _migrated:
-            await _auto_migrate(_pool)
+            await _auto_migrate(pool)
             _migrated = True
     except Exception as e:
         logger.warning("Database unavailable: %s", e)
-        _pool = None
-    return _pool
+        if pool is not None:
+            pool.terminate()
+        return None
+    _pool = pool
+    return pool
 
 
 async def _auto_migrate(pool: asyncpg.Pool) -> None:
-    """Add new columns to organizations table if they don't exist."""
-    for col_name, col_type in COLUMN_TYPES.items():
-        try:
-            await pool.execute(
-                f"ALTER TABLE organizations ADD COLUMN IF NOT EXISTS {col_name} {col_type}"
-            )
-        except Exception as e:
-            logger.warning("Migration failed for column %s: %s", col_name, e)
-    logger.info("Auto-migration complete: %d new columns checked", len(COLUMN_TYPES))
+    """Add new columns and cache-probe indexes to organizations table if they don't exist.
+
+    All columns are added in a single ALTER TABLE round-trip; on failure falls
+    back to one statement per column so a single bad column doesn't block the rest.
+    """
+    clauses = ", ".join(
+        f"ADD COLUMN IF NOT EXISTS {col_name} {col_type}"
+        for col_name, col_type in COLUMN_TYPES.items()
+    )
+    try:
+        await pool.execute(f"ALTER TABLE organizations {clauses}")
+    except Exception as e:
+        logger.warning("Batched migration failed, retrying per column: %s", e)
+        for col_name, col_type in COLUMN_TYPES.items():
+            try:
+                await pool.execute(
+                    f"ALTER TABLE organizations ADD COLUMN IF NOT EXISTS {col_name} {col_type}"
+                )
+            except Exception as e:
+                logger.warning("Migration failed for column %s: %s", col_name, e)
+    # Concurrent index builds can take long on a big table: don't hold up startup
+    global _index_task
+    if _index_task is None or _index_task.done():
+        _index_task = asyncio.create_task(_migrate_indexes())
+    logger.info(
+        "Auto-migration complete: %d new columns checked, index migration running in background",
+        len(COLUMN_TYPES),
+    )
+
+
+async def _migrate_indexes() -> None:
+    """Build cache-probe indexes without blocking writers.
+
+    CREATE INDEX CONCURRENTLY can't run inside a transaction and can outlast
+    the pool's command_timeout, so it runs on a dedicated connection with no
+    timeout. An INVALID index left by an interrupted build is dropped and rebuilt,
+    unless a build for it is still in progress. Only the worker holding the
+    advisory lock migrates; the others skip. Runs as a background task.
+    """
+    try:
+        conn = await asyncpg.connect(
+            host=DB_HOST,
+            port=DB_PORT,
+            database=DB_NAME,
+            user=DB_USER,
+            password=DB_PASSWORD,
+            command_timeout=None,
+            server_settings={"statement_timeout": "0"},
+        )
+    except Exception as e:
+        logger.warning("Index migration failed: %s", e)
+        return
+    try:
+        if not await conn.fetchval(_SQL_INDEX_LOCK):
+            logger.info("Index migration is running in another process, skipping")
+            return
+        for index_name in OBSOLETE_INDEXES:
+            try:
+                await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+            except Exception as e:
+                logger.warning("Failed to drop obsolete index %s: %s", index_name, e)
+        for index_name, index_def in INDEXES.items():
+            try:
+                if await conn.fetchval(_SQL_INDEX_INVALID, index_name):
+                    if await conn.fetchval(_SQL_INDEX_BUILDING, index_name):
+                        logger.info("Index %s is still being built, skipping", index_name)
+                        continue
+                    logger.warning("Rebuilding invalid index %s", index_name)
+                    await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+                await conn.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} {index_def}"
+                )
+            except Exception as e:
+                logger.warning("Migration failed for index %s: %s", index_name, e)
+        logger.info("Index migration complete: %d indexes checked", len(INDEXES))
+    except Exception as e:
+        logger.warning("Index migration failed: %s", e)
+    finally:
+        # Closing the session also releases the advisory lock
+        await conn.close()
 
 
 async def init_db() -> None:
@@ -114,73 +316,107 @@ async def init_db() -> None:
 
 
 async def close_db() -> None:
-    global _pool
+    global _pool, _pool_init, _index_task
+    for task in (_pool_init, _index_task):
+        if task is not None and not task.done():
+            task.cancel()
+    _pool_init = _index_task = None
     if _pool:
         await _pool.close()
         _pool = None
 
 
+async def _fetchrow_prepared(pool: asyncpg.Pool, query: str, *args):
+    """Fetch a single row through an explicitly prepared statement."""
+    async with pool.acquire() as conn:
+        stmt = await conn.prepare(query)
+        return await stmt.fetchrow(*args)
+
+
 def _row_to_company(row, cached: bool = True) -> Company:
-    """Convert a database row to a Company model, handling JSONB deserialization."""
-    data = {}
-    for col in COLUMNS:
-        val = row.get(col)
-        if col in JSONB_COLUMNS and isinstance(val, str):
-            try:
-                val = json.loads(val)
-            except (json.JSONDecodeError, TypeError):
-                pass
-        data[col] = val
+    """Convert a database row to a Company model (JSONB is decoded by the pool codec)."""
+    data = dict(zip(COLUMNS, row.values()))
 
-    updated = row["updated_at"]
+    updated = row[_UPDATED_AT_IDX]
     if updated and updated.tzinfo is None:
         updated = updated.replace(tzinfo=timezone.utc)
 
-    return Company(**data, cached=cached, cached_at=updated)
+    # Rows come from our own schema, so skip pydantic validation
+    return Company.model_construct(**data, cached=cached, cached_at=updated)
 
 
-async def get_cached(inn: str, force: bool = False) -> Company | None:
-    pool = await _ensure_pool()
-    if not pool or force:
+def _mem_get(key: str) -> Company | None:
+    hit = _mem.get(key)
+    if hit is None:
         return None
-
-    row = await pool.fetchrow(
-        "SELECT * FROM organizations WHERE inn = $1", inn
-    )
-    if not row:
+    expires_at, company = hit
+    if time.monotonic_ns() >= expires_at:
+        del _mem[key]
         return None
+    _mem.move_to_end(key)
+    return company
 
-    updated = row["updated_at"]
-    if updated.tzinfo is None:
-        updated = updated.replace(tzinfo=timezone.utc)
 
-    ttl = timedelta(hours=CACHE_TTL_HOURS)
-    if datetime.now(timezone.utc) - updated > ttl:
-        return None
+def _mem_put(key: str, company: Company, ttl_left: float) -> None:
+    _mem[key] = (time.monotonic_ns() + int(ttl_left * 1e9), company)
+    _mem.move_to_end(key)
+    while len(_mem) > MEMORY_CACHE_SIZE:
+        _mem.popitem(last=False)
 
-    return _row_to_company(row)
 
+def _mem_generation(key: str) -> int:
+    return _mem_gen.get(key, _mem_gen_floor)
 
-async def get_cached_by_ogrn(ogrn: str, force: bool = False) -> Company | None:
+
+def _mem_invalidate(company: Company) -> None:
+    """Drop a saved company from _mem; call after its write has committed."""
+    global _mem_gen_floor
+    seq = next(_write_seq)
+    keys = [f"inn:{company.inn}"]
+    if company.ogrn:
+        keys.append(f"ogrn:{company.ogrn}")
+    for key in keys:
+        _mem.pop(key, None)
+        _mem_gen[key] = seq
+        _mem_gen.move_to_end(key)
+    while len(_mem_gen) > MEMORY_CACHE_SIZE:
+        _, evicted = _mem_gen.popitem(last=False)
+        _mem_gen_floor = max(_mem_gen_floor, evicted)
+
+
+async def _get_cached_by(key: str, query: str, value: str) -> Company | None:
+    """Look up a fresh company in memory first, then in PostgreSQL."""
+    company = _mem_get(key)
+    if company:
+        return company
+
+    generation = _mem_generation(key)
     pool = await _ensure_pool()
-    if not pool or force:
+    if not pool:
         return None
 
-    row = await pool.fetchrow(
-        "SELECT * FROM organizations WHERE ogrn = $1", ogrn
-    )
+    row = await _fetchrow_prepared(pool, query, value, CACHE_TTL_HOURS)
     if not row:
         return None
 
-    updated = row["updated_at"]
-    if updated.tzinfo is None:
-        updated = updated.replace(tzinfo=timezone.utc)
+    company = _row_to_company(row)
+    # Keep the in-memory copy only for what is left of the row's TTL (in seconds)
+    ttl_left = _TTL_SECONDS - (time.time() - float(row["updated_epoch"]))
+    if _mem_generation(key) == generation:
+        _mem_put(key, company, ttl_left)
+    return company
 
-    ttl = timedelta(hours=CACHE_TTL_HOURS)
-    if datetime.now(timezone.utc) - updated > ttl:
+
+async def get_cached(inn: str, force: bool = False) -> Company | None:
+    if force:
         return None
+    return await _get_cached_by(f"inn:{inn}", _SQL_BY_INN, inn)
+
 
-    return _row_to_company(row)
+async def get_cached_by_ogrn(ogrn: str, force: bool = False) -> Company | None:
+    if force:
+        return None
+    return await _get_cached_by(f"ogrn:{ogrn}", _SQL_BY_OGRN, ogrn)
 
 
 async def save_company(company: Company) -> None:
@@ -188,29 +424,33 @@ async def save_company(company: Company) -> None:
     if not pool:
         return
 
-    values = []
-    for col in COLUMNS:
-        val = getattr(company, col)
-        # Serialize JSONB columns
-        if col in JSONB_COLUMNS and val is not None:
-            val = json.dumps(val, ensure_ascii=False)
-        values.append(val)
-
-    placeholders = ", ".join(f"${i+1}" for i in range(len(COLUMNS)))
-    col_names = ", ".join(COLUMNS)
-    updates = ", ".join(f"{col} = EXCLUDED.{col}" for col in COLUMNS if col != "inn")
-
-    query = f"""
-        INSERT INTO organizations ({col_names}, created_at, updated_at)
-        VALUES ({placeholders}, NOW(), NOW())
-        ON CONFLICT (inn) DO UPDATE SET
-            {updates},
-            updated_at = NOW()
-    """
-    await pool.execute(query, *values)
+    values = _pack_values(company)
+    async with pool.acquire() as conn:
+        stmt = await conn.prepare(_INSERT_SQL)
+        await stmt.fetch(*values)
+    _mem_invalidate(company)
+
+
+async def save_companies(companies: list[Company]) -> None:
+    """Upsert a batch of companies in one pipelined round-trip."""
+    if not companies:
+        return
+    pool = await _ensure_pool()
+    if not pool:
+        return
+
+    records = [_pack_values(company) for company in companies]
+    async with pool.acquire() as conn:
+        await conn.executemany(_INSERT_SQL, records)
+    for company in companies:
+        _mem_invalidate(company)
 
 
 async def get_stats() -> StatsResponse:
+    global _stats_cache, _stats_cache_until
+    if _stats_cache and time.monotonic() < _stats_cache_until:
+        return _stats_cache
+
     pool = await _ensure_pool()
     if not pool:
         return StatsResponse(total_cached=0)
@@ -222,8 +462,10 @@ async def get_stats() -> StatsResponse:
             MAX(updated_at) as newest
         FROM organizations
     """)
-    return StatsResponse(
+    _stats_cache = StatsResponse(
         total_cached=row["total"],
         oldest_entry=row["oldest"],
         newest_entry=row["newest"],
     )
+    _stats_cache_until = time.monotonic() + _STATS_TTL_SECONDS
+    return _stats_cache
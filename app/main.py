@@ -1,12 +1,19 @@
+import asyncio
 import logging
+import re
 from contextlib import asynccontextmanager
+from typing import Awaitable, Callable
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
 
 from app.config import REQUEST_DELAY
 from app.database import init_db, close_db, get_cached, get_cached_by_ogrn, save_company, get_stats
 from app.models import Company, SearchResult, StatsResponse
-from app.parser import get_company_by_inn, get_company_by_ogrn, search_companies
+from app.parser import (
+    CircuitOpenError, close_client, get_company_by_inn, get_company_by_ogrn, search_companies,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -14,6 +21,92 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_INN_RE = re.compile(r"\d{10}|\d{12}", re.ASCII).fullmatch
+_OGRN_RE = re.compile(r"\d{13}|\d{15}", re.ASCII).fullmatch
+
+# Background cache writes; strong refs keep tasks alive until they finish
+_pending: set[asyncio.Task] = set()
+
+
+async def _safe_save(company: Company) -> None:
+    try:
+        await save_company(company)
+    except Exception as e:
+        logger.error("Failed to cache company %s: %s", company.inn, e)
+
+
+def _schedule_save(company: Company) -> None:
+    """Save to cache in the background so the response isn't blocked on the DB write."""
+    task = asyncio.create_task(_safe_save(company))
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+
+
+_COMPANY_ADAPTER = TypeAdapter(Company)
+
+
+def _company_response(company: Company) -> Response:
+    """Serialize with pydantic-core directly, bypassing FastAPI's response re-validation."""
+    return Response(content=_COMPANY_ADAPTER.dump_json(company), media_type="application/json")
+
+
+# Head start given to the cache probe before the rusprofile fetch is started
+_CACHE_PROBE_TIMEOUT = 0.05
+
+
+def _cache_result(task: asyncio.Task) -> Company | None:
+    if task.cancelled():
+        return None
+    exc = task.exception()
+    if exc:
+        logger.warning("Cache lookup failed: %s", exc)
+        return None
+    return task.result()
+
+
+async def _cached_or_parse(
+    probe: Awaitable[Company | None],
+    parse: Callable[[], Awaitable[Company | None]],
+) -> tuple[Company | None, bool]:
+    """Race the cache probe against the rusprofile fetch.
+
+    Returns (company, from_cache). A fresh cached company always wins and
+    cancels the fetch; a slow or failing cache never delays a successful fetch,
+    but an empty or failed fetch waits for the cache before giving up.
+    """
+    cache_task = asyncio.create_task(probe)
+    parse_task = None
+    try:
+        done, _ = await asyncio.wait({cache_task}, timeout=_CACHE_PROBE_TIMEOUT)
+        if done:
+            cached = _cache_result(cache_task)
+            if cached:
+                return cached, True
+            return await parse(), False
+
+        parse_task = asyncio.create_task(parse())
+        done, _ = await asyncio.wait(
+            {cache_task, parse_task}, return_when=asyncio.FIRST_COMPLETED
+        )
+        if cache_task in done:
+            cached = _cache_result(cache_task)
+            if cached:
+                return cached, True
+            return await parse_task, False
+
+        if parse_task.exception() is None and parse_task.result():
+            return parse_task.result(), False
+        # The fetch failed or found nothing: a fresh cached row still beats that
+        await asyncio.wait({cache_task})
+        cached = _cache_result(cache_task)
+        if cached:
+            return cached, True
+        return parse_task.result(), False
+    finally:
+        for task in (cache_task, parse_task):
+            if task and not task.done():
+                task.cancel()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -23,6 +116,9 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error("Failed to connect to database: %s", e)
     yield
+    if _pending:
+        await asyncio.gather(*_pending, return_exceptions=True)
+    await close_client()
     await close_db()
 
 
@@ -34,6 +130,11 @@ app = FastAPI(
 )
 
 
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError):
+    return JSONResponse(status_code=503, content={"detail": "rusprofile.ru временно недоступен"})
+
+
 @app.get("/")
 async def health():
     return {"status": "ok", "service": "rusprofile-parser", "version": "2.0.0"}
@@ -41,50 +142,52 @@ async def health():
 
 @app.get("/company/inn/{inn}", response_model=Company)
 async def company_by_inn(inn: str, force: bool = Query(False)):
-    if not inn.isdigit() or len(inn) not in (10, 12):
+    if not _INN_RE(inn):
         raise HTTPException(400, "ИНН должен содержать 10 или 12 цифр")
 
-    if not force:
-        cached = await get_cached(inn)
-        if cached:
+    def parse():
+        logger.info("Parsing rusprofile for INN %s", inn)
+        return get_company_by_inn(inn, delay=REQUEST_DELAY, force=force)
+
+    if force:
+        company = await parse()
+    else:
+        company, from_cache = await _cached_or_parse(get_cached(inn), parse)
+        if from_cache:
             logger.info("Cache hit for INN %s", inn)
-            return cached
+            return _company_response(company)
 
-    logger.info("Parsing rusprofile for INN %s", inn)
-    company = await get_company_by_inn(inn, delay=REQUEST_DELAY)
     if not company:
         raise HTTPException(404, f"Организация с ИНН {inn} не найдена")
 
-    try:
-        await save_company(company)
-    except Exception as e:
-        logger.error("Failed to cache company %s: %s", inn, e)
+    _schedule_save(company)
 
-    return company
+    return _company_response(company)
 
 
 @app.get("/company/ogrn/{ogrn}", response_model=Company)
 async def company_by_ogrn(ogrn: str, force: bool = Query(False)):
-    if not ogrn.isdigit() or len(ogrn) not in (13, 15):
+    if not _OGRN_RE(ogrn):
         raise HTTPException(400, "ОГРН должен содержать 13 или 15 цифр")
 
-    if not force:
-        cached = await get_cached_by_ogrn(ogrn)
-        if cached:
+    def parse():
+        logger.info("Parsing rusprofile for OGRN %s", ogrn)
+        return get_company_by_ogrn(ogrn, delay=REQUEST_DELAY, force=force)
+
+    if force:
+        company = await parse()
+    else:
+        company, from_cache = await _cached_or_parse(get_cached_by_ogrn(ogrn), parse)
+        if from_cache:
             logger.info("Cache hit for OGRN %s", ogrn)
-            return cached
+            return _company_response(company)
 
-    logger.info("Parsing rusprofile for OGRN %s", ogrn)
-    company = await get_company_by_ogrn(ogrn, delay=REQUEST_DELAY)
     if not company:
         raise HTTPException(404, f"Организация с ОГРН {ogrn} не найдена")
 
-    try:
-        await save_company(company)
-    except Exception as e:
-        logger.error("Failed to cache company: %s", e)
+    _schedule_save(company)
 
-    return company
+    return _company_response(company)
 
 
 @app.get("/search", response_model=list[SearchResult])
@@ -3,17 +3,39 @@ import json
 import random
 import re
 import logging
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 import httpx
 from bs4 import BeautifulSoup
 
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from app.config import PARSER_CACHE_SIZE, PARSER_CACHE_TTL
 from app.models import Company, SearchResult
 
 logger = logging.getLogger(__name__)
 
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 BASE_URL = "https://www.rusprofile.ru"
 AJAX_URL = f"{BASE_URL}/ajax.php"
 
+_STATUS_ACTIVE = "Действующая"
+_STATUS_LIQUIDATED = "Ликвидирована"
+
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:134.0) Gecko/20100101 Firefox/134.0",
@@ -22,61 +44,476 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36 Edg/131.0.0.0",
 ]
 
-_last_request_time: float = 0
+# Rate limit: token bucket of _BURST requests refilled at one request per `delay`
+# (slowed down adaptively on upstream errors), with at most _MAX_CONCURRENCY in flight.
+_BURST = 4
+_MAX_CONCURRENCY = 16
+_sem = asyncio.Semaphore(_MAX_CONCURRENCY)
+
+# Retry transient failures with exponential backoff and full jitter
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_MAX_TRIES = 4
+_RETRY_BASE = 0.5
+_RETRY_CAP = 10.0
+_RETRY_AFTER_MAX = 60.0
+
+# Shared client: keeps TCP/TLS connections (and HTTP/2 sessions) alive across requests
+_client: httpx.AsyncClient | None = None
+
+# Pre-compiled patterns used by the _parse_* functions
+_RE_INN10_12 = re.compile(r"^\d{10,12}$")
+_RE_INN12_SUFFIX = re.compile(r"(\d{12})$")
+_RE_OGRN_FROM = re.compile(r"от\s+(.+)")
+_RE_SINCE = re.compile(r"с\s+(.+)")
+_RE_CEO_START = re.compile(r"с\s+(\d+\s+\w+\s+\d{4}\s*г\.?)")
+_RE_CEO_OTHER = re.compile(r"еще\s+(\d+)\s+организаци")
+_RE_MSP_DATE = re.compile(r"с?\s*(\d[\d.]+\d{4}|\d+\s+\w+\s+\d{4})")
+_RE_TAX_AUTHORITY = re.compile(r"(.+?)\s+с\s+(\d+\s+\w+\s+\d{4}\s*г\.?)\s*$")
+_RE_TAX_AUTHORITY_LABEL = re.compile(r"Налоговый орган")
+_RE_FINANCE_YEAR = re.compile(r"за\s+(\d{4})\s*(?:год|г\.?)")
+_RE_YEAR = re.compile(r"за\s+(\d{4})")
+_RE_AMOUNT_RUB = re.compile(r"(.+?руб\.?)")
+_RE_PCT_CHANGE = re.compile(r"([↑↓±]?[+\-]?\d+[\s,.]?\d*\s*%)")
+_RE_STABILITY = re.compile(r"(?:(?:Ф|ф)инансов\w+\s+устойчивость)\s+(\w+)")
+_RE_SOLVENCY = re.compile(r"(?:(?:П|п)лат[её]жеспособность)\s+(\w+)")
+_RE_EFFICIENCY = re.compile(r"(?:(?:Э|э)ффективность)\s+(\w+)")
+_RE_INN_LABEL = re.compile(r"ИНН")
+_RE_SHARE_LABEL = re.compile(r"Доля")
+_RE_ENFORCEMENT_COUNT = re.compile(r"Производств\D*(\d+)")
+_RE_ENFORCEMENT_SUM = re.compile(r"(?:[Нн]а сумму)\s+(.+?руб\.?)")
+# Rating lives in the RPF.store script; matched on raw HTML, no DOM needed
+_RE_RELIABILITY = re.compile(
+    r"""check_counterparty[\s\S]{0,4000}?reliability['"]?\s*:\s*['"](\w+)['"]"""
+)
+_RE_SECTION_TOTAL = re.compile(
+    r"(\d[\d\s]*\d)\s+(?:провер|дел[ао\s]|закуп|лицензи|филиал|товарн|залог|договор)"
+)
+_RE_SECTION_SUM = re.compile(r"на сумму\s+(.+?руб\.?)", re.IGNORECASE)
+# Matched on the lowercased raw HTML: [^<\n] keeps the match inside a single text node
+_RE_ADDRESS_UNRELIABLE_TEXT = re.compile(r"сведения об адресе[^<\n]*недостоверн")
+_RE_ADDRESS_UNRELIABLE_CLASS = re.compile(r"address.*unreliable|unreliable.*address")
 
 
 def _clean_inn(raw: str) -> str:
-    return re.sub(r"[!~]", "", raw).strip()
+    return raw.replace("!", "").replace("~", "").strip()
+
+
+_BASE_HEADERS = {
+    "Accept": "application/json, text/html, */*",
+    "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Referer": BASE_URL,
+}
 
 
 def _get_headers() -> dict:
-    return {
-        "User-Agent": random.choice(USER_AGENTS),
-        "Accept": "application/json, text/html, */*",
-        "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
-        "Referer": BASE_URL,
-    }
+    return {"User-Agent": random.choice(USER_AGENTS), **_BASE_HEADERS}
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Lazily create the process-wide rusprofile client."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=20,
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    global _client
+    if _client:
+        await _client.aclose()
+        _client = None
+
+
+class _AIMDLimiter:
+    """Token bucket whose refill rate adapts to upstream feedback (AIMD).
+
+    The base rate is one request per `delay` seconds with bursts of up to
+    `burst`. Each upstream failure multiplies the rate by `decrease` (down to
+    `min_fraction` of the base rate) and honors Retry-After for all callers;
+    each success adds `increase` back, never exceeding the base rate.
+    """
+
+    def __init__(
+        self,
+        burst: int = _BURST,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+        min_fraction: float = 1 / 16,
+    ) -> None:
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.min_fraction = min_fraction
+        self.fraction = 1.0
+        self._tokens = float(burst)
+        self._updated_at: float | None = None
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, delay: float) -> None:
+        """Wait until a request may be sent at the current rate."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            if self._paused_until > loop.time():
+                await asyncio.sleep(self._paused_until - loop.time())
+            if delay <= 0:
+                return
+            rate = self.fraction / delay
+            now = loop.time()
+            if self._updated_at is not None:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * rate)
+            self._updated_at = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / rate)
+                self._tokens = 1.0
+                self._updated_at = loop.time()
+            self._tokens -= 1
+
+    def on_success(self) -> None:
+        self.fraction = min(1.0, self.fraction + self.increase)
+
+    def on_failure(self, retry_after: float | None = None) -> None:
+        self.fraction = max(self.min_fraction, self.fraction * self.decrease)
+        if retry_after:
+            loop = asyncio.get_running_loop()
+            self._paused_until = max(self._paused_until, loop.time() + retry_after)
+
+
+class CircuitOpenError(Exception):
+    """Raised when rusprofile requests are short-circuited by an open breaker."""
+
+
+def _is_upstream_failure(exc: BaseException | None) -> bool:
+    """Timeouts, connection errors, 429 and 5xx count against the upstream."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        code = exc.response.status_code
+        return code == 429 or code >= 500
+    return False
+
+
+class CircuitBreaker:
+    """Failure-ratio circuit breaker around rusprofile.ru calls.
+
+    CLOSED: calls pass and their outcomes over the last `sampling_duration`
+    seconds are sampled; once at least `minimum_throughput` calls were seen
+    and the failure ratio reaches `failure_threshold`, the breaker trips.
+    OPEN: calls fail fast with CircuitOpenError for `break_duration` seconds.
+    HALF_OPEN: a single trial call passes; success closes, failure reopens.
+
+    Usage: `async with breaker.call(): ...`. Only the trial call resolves
+    HALF_OPEN; outcomes of calls admitted before a trip are ignored.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        minimum_throughput: int = 5,
+        break_duration: float = 30.0,
+        sampling_duration: float = 10.0,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.minimum_throughput = minimum_throughput
+        self.break_duration = break_duration
+        self.sampling_duration = sampling_duration
+        self.state = self.CLOSED
+        self._samples: deque[tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @asynccontextmanager
+    async def call(self):
+        """Guard one call; raises CircuitOpenError if it is short-circuited."""
+        trial = self._admit()
+        try:
+            yield
+        except Exception as e:
+            self._record(trial, _is_upstream_failure(e))
+            raise
+        except BaseException:
+            # Cancelled: no verdict on the upstream, just free the trial slot
+            if trial:
+                self._trial_in_flight = False
+            raise
+        self._record(trial, False)
+
+    def _admit(self) -> bool:
+        """Let a call through or raise; returns True if it is the HALF_OPEN trial."""
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.break_duration:
+                raise CircuitOpenError("rusprofile.ru circuit is open")
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                raise CircuitOpenError("rusprofile.ru circuit is half-open, trial in flight")
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def _record(self, trial: bool, failed: bool) -> None:
+        now = time.monotonic()
+        if trial:
+            self._trial_in_flight = False
+            if failed:
+                self._trip(now)
+            else:
+                logger.info("Circuit breaker closed")
+                self.state = self.CLOSED
+                self._samples.clear()
+            return
+        if self.state != self.CLOSED:
+            # Admitted before the breaker tripped: no say in OPEN/HALF_OPEN
+            return
+
+        self._samples.append((now, failed))
+        cutoff = now - self.sampling_duration
+        while self._samples[0][0] < cutoff:
+            self._samples.popleft()
+        if len(self._samples) >= self.minimum_throughput:
+            failures = sum(1 for _, f in self._samples if f)
+            if failures / len(self._samples) >= self.failure_threshold:
+                self._trip(now)
+
+    def _trip(self, now: float) -> None:
+        logger.warning("Circuit breaker opened for %.0fs", self.break_duration)
+        self.state = self.OPEN
+        self._opened_at = now
+        self._samples.clear()
+
+
+_breaker = CircuitBreaker()
+_limiter = _AIMDLimiter()
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, httpx.TransportError):
+        return True
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code in _RETRY_STATUSES
+    )
 
 
-async def _throttle(delay: float) -> None:
-    global _last_request_time
-    now = asyncio.get_event_loop().time()
-    wait = delay - (now - _last_request_time)
-    if wait > 0:
-        await asyncio.sleep(wait)
-    _last_request_time = asyncio.get_event_loop().time()
+def _retry_after(resp: httpx.Response) -> float | None:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), _RETRY_AFTER_MAX)
 
 
-async def search_ajax(query: str, delay: float = 2.5) -> list[dict]:
-    """Search rusprofile via AJAX endpoint. Returns raw result dicts."""
-    await _throttle(delay)
-    async with httpx.AsyncClient(timeout=15, follow_redirects=True) as client:
-        resp = await client.get(
-            AJAX_URL,
-            params={"query": query, "action": "search"},
-            headers=_get_headers(),
-        )
-        resp.raise_for_status()
-        data = resp.json()
+async def _fetch(url: str, delay: float, **kwargs) -> httpx.Response:
+    """GET a rusprofile URL under the circuit breaker, rate limit and concurrency cap.
 
-    results = []
-    for item in data.get("ul", []):
-        results.append(item)
-    for item in data.get("ip", []):
-        results.append(item)
-    return results
+    Transient failures (network errors, timeouts, 429, 5xx) are retried with
+    exponential backoff and full jitter, honoring Retry-After; other 4xx are not.
+    """
+    attempt = 0
+    while True:
+        try:
+            async with _breaker.call():
+                await _limiter.acquire(delay)
+                async with _sem:
+                    resp = await _get_client().get(url, headers=_get_headers(), **kwargs)
+                resp.raise_for_status()
+            _limiter.on_success()
+            return resp
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            retry_after = None
+            if isinstance(e, httpx.HTTPStatusError):
+                retry_after = _retry_after(e.response)
+            if _is_upstream_failure(e):
+                _limiter.on_failure(retry_after)
+            attempt += 1
+            if attempt >= _RETRY_MAX_TRIES or not _is_retryable(e):
+                raise
+            backoff = random.uniform(0, min(_RETRY_CAP, _RETRY_BASE * 2 ** (attempt - 1)))
+            if retry_after is not None:
+                backoff = max(backoff, retry_after)
+            logger.info("Retrying %s in %.1fs after: %s", url, backoff, e)
+            await asyncio.sleep(backoff)
+
+
+class _AsyncTTLCache:
+    """LRU + TTL memo for coroutine results.
+
+    Concurrent callers for the same key share one in-flight call, which is
+    cancelled once its last waiter is cancelled. Only successful results are
+    stored; failures propagate and are not cached. Results rejected by
+    `should_store` are returned but not stored either.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, should_store=None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.should_store = should_store
+        self._data: OrderedDict = OrderedDict()
+        self._inflight: dict = {}
+        self._waiters: dict[asyncio.Future, int] = {}
+
+    async def get_or_call(self, key, factory):
+        hit = self._data.get(key)
+        if hit is not None:
+            expires_at, value = hit
+            if time.monotonic() < expires_at:
+                self._data.move_to_end(key)
+                return value
+            del self._data[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._store(key, t))
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # shield: one caller being cancelled must not cancel the shared call...
+            return await asyncio.shield(task)
+        finally:
+            remaining = self._waiters.pop(task) - 1
+            if remaining:
+                self._waiters[task] = remaining
+            elif not task.done():
+                # ...but once nobody is waiting, stop the upstream request
+                if self._inflight.get(key) is task:
+                    del self._inflight[key]
+                task.cancel()
+
+    def _store(self, key, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self.should_store is not None and not self.should_store(task.result()):
+            return
+        self._data[key] = (time.monotonic() + self.ttl, task.result())
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class _SearchResults(list):
+    """AJAX result dicts plus INN/OGRN indexes built on first use.
+
+    The list is memoized in _search_cache, so repeat lookups against the
+    same result set are dict hits instead of linear scans. First match wins.
+    """
+
+    __slots__ = ("_by_inn", "_by_ogrn")
+
+    def by_inn(self) -> dict:
+        try:
+            return self._by_inn
+        except AttributeError:
+            index = {}
+            for item in self:
+                index.setdefault(_clean_inn(item.get("inn", "")), item)
+            self._by_inn = index
+            return index
+
+    def by_ogrn(self) -> dict:
+        try:
+            return self._by_ogrn
+        except AttributeError:
+            index = {}
+            for item in self:
+                for key in (item.get("ogrn"), item.get("raw_ogrn")):
+                    if key:
+                        index.setdefault(key, item)
+            self._by_ogrn = index
+            return index
+
+
+# Memoized AJAX results (by query) and parsed page fields (by URL). An empty
+# parse (captcha or changed markup behind a 200) is not cached, so the next
+# lookup refetches the page instead of hiding its fields for the whole TTL.
+_search_cache = _AsyncTTLCache(PARSER_CACHE_SIZE, PARSER_CACHE_TTL)
+_page_cache = _AsyncTTLCache(PARSER_CACHE_SIZE, PARSER_CACHE_TTL, should_store=bool)
+
+# Last known page URL per INN/OGRN, so a repeat lookup can fetch the page
+# concurrently with the AJAX search instead of after it
+_page_urls: OrderedDict[str, str] = OrderedDict()
+
+
+def _remember_page_url(query: str, url: str) -> None:
+    _page_urls[query] = url
+    _page_urls.move_to_end(query)
+    while len(_page_urls) > PARSER_CACHE_SIZE:
+        _page_urls.popitem(last=False)
+
+
+async def search_ajax(query: str, delay: float = 2.5, force: bool = False) -> _SearchResults:
+    """Search rusprofile via AJAX endpoint. Returns raw result dicts.
+
+    Results are memoized per query for PARSER_CACHE_TTL seconds unless `force`.
+    """
+    if force:
+        return await _search_ajax(query, delay)
+    return await _search_cache.get_or_call(query, lambda: _search_ajax(query, delay))
+
+
+async def _search_ajax(query: str, delay: float) -> _SearchResults:
+    resp = await _fetch(
+        AJAX_URL, delay, params={"query": query, "action": "search"}, timeout=15
+    )
+    data = _json_loads(resp.content)
+    return _SearchResults([*data.get("ul", ()), *data.get("ip", ())])
+
+
+# Validated Company per (INN, OGRN); Company is frozen, so hits are shared.
+# The source item is kept to detect a refreshed search result for the same key.
+_ajax_item_cache: OrderedDict[tuple, tuple[dict, Company]] = OrderedDict()
 
 
 def _parse_ajax_item(item: dict) -> Company:
-    """Convert an AJAX result item to a Company model."""
+    """Convert an AJAX result item to a Company model, memoized by (INN, OGRN)."""
+    key = (item.get("inn"), item.get("ogrn") or item.get("raw_ogrn"))
+    hit = _ajax_item_cache.get(key)
+    # Identity is the common case: _search_cache hands back the same item dicts
+    if hit is not None and (hit[0] is item or hit[0] == item):
+        _ajax_item_cache.move_to_end(key)
+        return hit[1]
+    company = _build_ajax_company(item)
+    _ajax_item_cache[key] = (item, company)
+    _ajax_item_cache.move_to_end(key)
+    while len(_ajax_item_cache) > PARSER_CACHE_SIZE:
+        _ajax_item_cache.popitem(last=False)
+    return company
+
+
+def _build_ajax_company(item: dict) -> Company:
     inn = _clean_inn(item.get("inn", ""))
-    inactive = item.get("inactive", 0)
-    status = "Ликвидирована" if inactive else "Действующая"
+    status = _STATUS_LIQUIDATED if item.get("inactive", 0) else _STATUS_ACTIVE
     capital_raw = item.get("authorized_capital")
     capital = None
     if capital_raw:
         try:
-            capital = f"{float(capital_raw):,.0f} руб.".replace(",", " ")
+            # Whole-number amounts (the usual case) skip the float round trip
+            if isinstance(capital_raw, int) or (
+                isinstance(capital_raw, str) and capital_raw.isdecimal()
+            ):
+                capital = f"{int(capital_raw):,} руб.".replace(",", " ")
+            else:
+                capital = f"{float(capital_raw):,.0f} руб.".replace(",", " ")
         except (ValueError, TypeError):
             capital = str(capital_raw)
 
@@ -116,43 +553,106 @@ def _get_next_dds(dt_el) -> list:
     return dds
 
 
-def _find_dt_by_text(soup, text: str):
-    """Find a <dt> element containing the given text."""
-    for dt in soup.find_all("dt"):
-        if text in dt.get_text():
+def _dt_index(root) -> dict:
+    """Index all <dt> elements under root by their text, first occurrence wins."""
+    index = {}
+    for dt in root.find_all("dt"):
+        index.setdefault(dt.get_text(), dt)
+    return index
+
+
+def _find_dt_by_text(dt_index: dict, text: str):
+    """Find an indexed <dt> element containing the given text."""
+    for dt_text, dt in dt_index.items():
+        if text in dt_text:
             return dt
     return None
 
 
-def _parse_basic_fields(soup) -> dict:
+def _row_index(root) -> dict:
+    """Index company-row blocks by their company-info__title text, first occurrence wins."""
+    index = {}
+    for row in root.find_all(class_="company-row"):
+        title_el = row.find(class_="company-info__title")
+        if title_el:
+            index.setdefault(title_el.get_text(), row)
+    return index
+
+
+def _find_row_by_title(row_index: dict, text: str):
+    """Find an indexed company-row whose title contains the given text."""
+    for title, row in row_index.items():
+        if text in title:
+            return row
+    return None
+
+
+def _dt_dd_pairs(root) -> list[tuple[str, str]]:
+    """(dt text, dd text) for every <dt> under root and its next <dd> sibling.
+
+    One pass over the dt/dd elements; each element's text is extracted once.
+    """
+    pairs: list[list] = []
+    pending: dict[int, list[list]] = {}
+    for el in root.find_all(["dt", "dd"]):
+        parent_key = id(el.parent)
+        if el.name == "dt":
+            pair = [el.get_text(strip=True), None]
+            pairs.append(pair)
+            pending.setdefault(parent_key, []).append(pair)
+        else:
+            waiting = pending.pop(parent_key, None)
+            if waiting:
+                dd_text = el.get_text(strip=True)
+                for pair in waiting:
+                    pair[1] = dd_text
+    return [(dt_text, dd_text) for dt_text, dd_text in pairs if dd_text is not None]
+
+
+_CLIP_FIELDS = {
+    "clip_kpp": "kpp",
+    "clip_okpo": "okpo",
+    "clip_okato": "okato",
+    "clip_oktmo": "oktmo",
+    "clip_okfs": "okfs",
+    "clip_okogu": "okogu",
+}
+_BASIC_IDS = frozenset({*_CLIP_FIELDS, "clip_name-long", "clip_okopf"})
+_BASIC_SELECTOR = ", ".join(
+    [*("#" + el_id for el_id in sorted(_BASIC_IDS)), "[itemprop=legalName]"]
+)
+
+
+def _parse_basic_fields(soup, dt_index: dict) -> dict:
     """Extract basic fields from clip elements and dt/dd pairs."""
     extra = {}
 
+    # One traversal for every id/itemprop target; first occurrence wins
+    found = {}
+    for el in soup.select(_BASIC_SELECTOR):
+        el_id = el.get("id")
+        if el_id in _BASIC_IDS:
+            found.setdefault(el_id, el)
+        if el.get("itemprop") == "legalName":
+            found.setdefault("legalName", el)
+
     # Clip-based fields
-    clip_map = {
-        "clip_kpp": "kpp",
-        "clip_okpo": "okpo",
-        "clip_okato": "okato",
-        "clip_oktmo": "oktmo",
-        "clip_okfs": "okfs",
-        "clip_okogu": "okogu",
-    }
-    for clip_id, field in clip_map.items():
-        el = soup.find(id=clip_id)
+    for clip_id, field in _CLIP_FIELDS.items():
+        el = found.get(clip_id)
         if el:
             extra[field] = el.get_text(strip=True)
 
     # Full name
-    legal_el = soup.find(attrs={"itemprop": "legalName"})
+    legal_el = found.get("legalName")
     if legal_el:
         extra["full_name"] = legal_el.get_text(strip=True)
     if not extra.get("full_name"):
-        clip_name = soup.find(id="clip_name-long")
+        clip_name = found.get("clip_name-long")
         if clip_name:
             extra["full_name"] = clip_name.get_text(strip=True)
 
     # ОКОПФ code and name
-    okopf_el = soup.find(id="clip_okopf")
+    okopf_el = found.get("clip_okopf")
     if okopf_el:
         extra["okopf_code"] = okopf_el.get_text(strip=True)
         # Name is in the next <dd> with class="chief-title" span
@@ -165,12 +665,14 @@ def _parse_basic_fields(soup) -> dict:
                     extra["okopf_name"] = chief.get_text(strip=True)
 
     # OGRN date from second <dd> after <dt>ОГРН</dt>
-    ogrn_dt = _find_dt_by_text(soup, "ОГРН")
+    ogrn_dt = _find_dt_by_text(dt_index, "ОГРН")
     if ogrn_dt:
         dds = _get_next_dds(ogrn_dt)
         for dd in dds:
             dd_text = dd.get_text(strip=True)
-            m = re.search(r"от\s+(.+)", dd_text)
+            if "от" not in dd_text:
+                continue
+            m = _RE_OGRN_FROM.search(dd_text)
             if m:
                 extra["ogrn_date"] = m.group(1).strip()
                 break
@@ -178,68 +680,61 @@ def _parse_basic_fields(soup) -> dict:
     return extra
 
 
-def _parse_ceo(soup) -> dict:
+def _parse_ceo(row_index: dict) -> dict:
     """Extract CEO details from the company-row block."""
     extra = {}
 
-    # Find CEO row by company-info__title or company-row
-    ceo_row = None
-    for row in soup.find_all(class_="company-row"):
-        title_el = row.find(class_="company-info__title")
-        if title_el and "уководител" in title_el.get_text():
-            ceo_row = row
-            break
-
+    # Find CEO row by its company-info__title
+    ceo_row = _find_row_by_title(row_index, "уководител")
     if not ceo_row:
         return extra
 
     # CEO INN from person link (12-digit suffix in slug)
-    person_link = ceo_row.find("a", href=re.compile(r"/person/"))
+    person_link = ceo_row.select_one('a[href*="/person/"]')
     if person_link:
         href = person_link.get("href", "")
         slug = href.rstrip("/").split("/")[-1] if "/" in href else ""
-        inn_match = re.search(r"(\d{12})$", slug)
+        inn_match = _RE_INN12_SUFFIX.search(slug)
         if inn_match:
             extra["ceo_inn"] = inn_match.group(1)
 
     # CEO start date ("с 22 января 2008 г.")
     for span in ceo_row.find_all("span", class_="chief-title"):
         span_text = span.get_text(strip=True)
-        date_match = re.search(r"с\s+(\d+\s+\w+\s+\d{4}\s*г\.?)", span_text)
+        date_match = _RE_CEO_START.search(span_text)
         if date_match:
             extra["ceo_start_date"] = date_match.group(1).strip()
             break
 
     # CEO other companies ("еще N организаций" or "Руководитель еще N организаций")
     row_text = ceo_row.get_text()
-    other_match = re.search(r"еще\s+(\d+)\s+организаци", row_text)
+    other_match = _RE_CEO_OTHER.search(row_text)
     if other_match:
         extra["ceo_other_companies"] = int(other_match.group(1))
 
     return extra
 
 
-def _parse_msp(soup) -> dict:
+def _parse_msp(dt_index: dict, row_index: dict) -> dict:
     """Extract MSP (small/medium enterprise registry) status."""
     extra = {}
 
     # Try company-info structure
-    for row in soup.find_all(class_="company-row"):
-        title_el = row.find(class_="company-info__title")
-        if title_el and "Реестр МСП" in title_el.get_text():
-            text_el = row.find(class_="company-info__text")
-            if text_el:
-                msp_text = text_el.get_text(strip=True)
-                if msp_text and msp_text != "не входит":
-                    extra["msp_status"] = msp_text
-                    # Try to extract date
-                    date_match = re.search(r"с?\s*(\d[\d.]+\d{4}|\d+\s+\w+\s+\d{4})", msp_text)
-                    if date_match:
-                        extra["msp_date"] = date_match.group(1)
-            return extra
+    msp_row = _find_row_by_title(row_index, "Реестр МСП")
+    if msp_row:
+        text_el = msp_row.find(class_="company-info__text")
+        if text_el:
+            msp_text = text_el.get_text(strip=True)
+            if msp_text and msp_text != "не входит":
+                extra["msp_status"] = msp_text
+                # Try to extract date
+                date_match = _RE_MSP_DATE.search(msp_text)
+                if date_match:
+                    extra["msp_date"] = date_match.group(1)
+        return extra
 
     # Try dt/dd pattern
-    msp_dt = _find_dt_by_text(soup, "Реестр МСП")
+    msp_dt = _find_dt_by_text(dt_index, "Реестр МСП")
     if msp_dt:
         dd = msp_dt.find_next_sibling("dd")
         if dd:
@@ -250,18 +745,18 @@ def _parse_msp(soup) -> dict:
     return extra
 
 
-def _parse_tax_authority(soup) -> dict:
+def _parse_tax_authority(soup, dt_index: dict) -> dict:
     """Extract tax authority name and date."""
     extra = {}
 
     # Try dt/dd pattern
-    tax_dt = _find_dt_by_text(soup, "Налоговый орган")
+    tax_dt = _find_dt_by_text(dt_index, "Налоговый орган")
     if tax_dt:
         dd = tax_dt.find_next_sibling("dd")
         if dd:
             tax_text = dd.get_text(strip=True)
             # "Название ФНС с 20 июля 2018 г."
-            date_match = re.search(r"(.+?)\s+с\s+(\d+\s+\w+\s+\d{4}\s*г\.?)\s*$", tax_text)
+            date_match = _RE_TAX_AUTHORITY.search(tax_text)
             if date_match:
                 extra["tax_authority"] = date_match.group(1).strip()
                 extra["tax_authority_date"] = date_match.group(2).strip()
@@ -270,7 +765,7 @@ def _parse_tax_authority(soup) -> dict:
         return extra
 
     # Try company-info structure (separate spans)
-    for el in soup.find_all(string=re.compile(r"Налоговый орган")):
+    for el in soup.find_all(string=_RE_TAX_AUTHORITY_LABEL):
         parent = el.parent
         if parent:
             container = parent.parent
@@ -283,7 +778,7 @@ def _parse_tax_authority(soup) -> dict:
                         date = texts[i + 2] if i + 2 < len(texts) else None
                         extra["tax_authority"] = name
                         if date:
-                            date_match = re.search(r"с\s+(.+)", date)
+                            date_match = _RE_SINCE.search(date)
                             if date_match:
                                 extra["tax_authority_date"] = date_match.group(1).strip()
                         break
@@ -292,11 +787,11 @@ def _parse_tax_authority(soup) -> dict:
     return extra
 
 
-def _parse_finances(soup) -> dict:
+def _parse_finances(tiles: dict) -> dict:
     """Extract financial data from the finance tile."""
     extra = {}
 
-    finance_tile = soup.find(class_="finance-tile")
+    finance_tile = tiles.get("finance-tile")
     if not finance_tile:
         return extra
 
@@ -305,37 +800,30 @@ def _parse_finances(soup) -> dict:
         return extra
 
     # Revenue year from context ("за 2024 год")
-    year_match = re.search(r"за\s+(\d{4})\s*(?:год|г\.?)", tile_text)
+    year_match = _RE_FINANCE_YEAR.search(tile_text)
     if year_match:
         extra["revenue_year"] = int(year_match.group(1))
 
     # Method 1: dt/dd structure (smaller companies)
-    for dt in finance_tile.find_all("dt"):
-        dt_text = dt.get_text(strip=True)
-        dd = dt.find_next_sibling("dd")
-        if not dd:
-            continue
-        dd_text = dd.get_text(strip=True)
-
+    for dt_text, dd_text in _dt_dd_pairs(finance_tile):
         if "Выручка" in dt_text:
-            amount_match = re.match(r"(.+?руб\.?)", dd_text)
+            amount_match = _RE_AMOUNT_RUB.match(dd_text)
             if amount_match:
                 extra["revenue"] = amount_match.group(1).strip()
-            change_match = re.search(r"([↑↓±]?[+\-]?\d+[\s,.]?\d*\s*%)", dd_text)
+            change_match = _RE_PCT_CHANGE.search(dd_text)
             if change_match:
                 extra["revenue_change"] = change_match.group(1).strip()
         elif "Прибыль" in dt_text:
-            amount_match = re.match(r"(.+?руб\.?)", dd_text)
+            amount_match = _RE_AMOUNT_RUB.match(dd_text)
             if amount_match:
                 extra["profit"] = amount_match.group(1).strip()
-            change_match = re.search(r"([↑↓±]?[+\-]?\d+[\s,.]?\d*\s*%)", dd_text)
+            change_match = _RE_PCT_CHANGE.search(dd_text)
             if change_match:
                 extra["profit_change"] = change_match.group(1).strip()
 
     # Method 2: div.finance-col structure (larger companies)
     if not extra.get("revenue"):
         for col in finance_tile.find_all(class_="finance-col"):
-            col_text = col.get_text()
             opener = col.find(class_="tab-opener")
             if not opener:
                 continue
@@ -357,7 +845,7 @@ def _parse_finances(soup) -> dict:
             diff_el = col.find(class_="diff")
             change = None
             if diff_el:
-                change_match = re.search(r"([↑↓±]?[+\-]?\d+[\s,.]?\d*\s*%)", diff_el.get_text())
+                change_match = _RE_PCT_CHANGE.search(diff_el.get_text())
                 if change_match:
                     change = change_match.group(1).strip()
 
@@ -373,21 +861,15 @@ def _parse_finances(soup) -> dict:
                     extra["profit_change"] = change
 
     # Financial stability, solvency, efficiency from text
-    stability_match = re.search(
-        r"(?:(?:Ф|ф)инансов\w+\s+устойчивость)\s+(\w+)", tile_text
-    )
+    stability_match = _RE_STABILITY.search(tile_text)
     if stability_match:
         extra["financial_stability"] = stability_match.group(1).strip()
 
-    solvency_match = re.search(
-        r"(?:(?:П|п)лат[её]жеспособность)\s+(\w+)", tile_text
-    )
+    solvency_match = _RE_SOLVENCY.search(tile_text)
     if solvency_match:
         extra["solvency"] = solvency_match.group(1).strip()
 
-    efficiency_match = re.search(
-        r"(?:(?:Э|э)ффективность)\s+(\w+)", tile_text
-    )
+    efficiency_match = _RE_EFFICIENCY.search(tile_text)
     if efficiency_match:
         val = efficiency_match.group(1).strip()
         # Skip if it matched a non-rating word (e.g. navigation)
@@ -397,11 +879,11 @@ def _parse_finances(soup) -> dict:
     return extra
 
 
-def _parse_founders(soup) -> dict:
+def _parse_founders(tiles: dict) -> dict:
     """Extract founders from the founders tile."""
     extra = {}
 
-    founders_tile = soup.find(class_="founders-tile")
+    founders_tile = tiles.get("founders-tile")
     if not founders_tile:
         return extra
 
@@ -424,7 +906,7 @@ def _parse_founders(soup) -> dict:
                     founder["type"] = "physical"
                     # Try to extract INN from person URL
                     slug = href.rstrip("/").split("/")[-1]
-                    inn_m = re.search(r"(\d{12})$", slug)
+                    inn_m = _RE_INN12_SUFFIX.search(slug)
                     if inn_m:
                         founder["inn"] = inn_m.group(1)
                 elif "/id/" in href:
@@ -433,17 +915,17 @@ def _parse_founders(soup) -> dict:
                 founder["name"] = title_el.get_text(strip=True)
 
         # INN from dt/dd
-        inn_dt = item.find("dt", string=re.compile(r"ИНН"))
+        inn_dt = item.find("dt", string=_RE_INN_LABEL)
         if inn_dt:
             inn_dd = inn_dt.find_next_sibling("dd")
             if inn_dd:
                 inn_span = inn_dd.find("span", class_="inn")
                 inn_text = inn_span.get_text(strip=True) if inn_span else inn_dd.get_text(strip=True)
-                if inn_text and re.match(r"^\d{10,12}$", inn_text):
+                if inn_text and _RE_INN10_12.match(inn_text):
                     founder["inn"] = inn_text
 
         # Share
-        share_dt = item.find("dt", string=re.compile(r"Доля"))
+        share_dt = item.find("dt", string=_RE_SHARE_LABEL)
         if share_dt:
             share_dd = share_dt.find_next_sibling("dd")
             if share_dd:
@@ -458,11 +940,11 @@ def _parse_founders(soup) -> dict:
     return extra
 
 
-def _parse_enforcement(soup) -> dict:
+def _parse_enforcement(tiles: dict) -> dict:
     """Extract enforcement proceedings from FSSP tile."""
     extra = {}
 
-    fssp_tile = soup.find(class_="fssp-tile")
+    fssp_tile = tiles.get("fssp-tile")
     if not fssp_tile:
         return extra
 
@@ -471,43 +953,40 @@ def _parse_enforcement(soup) -> dict:
         return extra
 
     # Count - look for "Производств" followed by number
-    prod_text = re.search(r"Производств\D*(\d+)", tile_text)
-    if prod_text:
-        extra["enforcement_count"] = int(prod_text.group(1))
+    if "Производств" in tile_text:
+        prod_text = _RE_ENFORCEMENT_COUNT.search(tile_text)
+        if prod_text:
+            extra["enforcement_count"] = int(prod_text.group(1))
 
     # Sum - "На сумму X руб."
-    sum_match = re.search(r"(?:[Нн]а сумму)\s+(.+?руб\.?)", tile_text)
-    if sum_match:
-        extra["enforcement_sum"] = sum_match.group(1).strip()
+    if "а сумму" in tile_text:
+        sum_match = _RE_ENFORCEMENT_SUM.search(tile_text)
+        if sum_match:
+            extra["enforcement_sum"] = sum_match.group(1).strip()
 
     return extra
 
 
-def _parse_taxes(soup) -> dict:
+def _parse_taxes(tiles: dict) -> dict:
     """Extract tax data from the taxes tile."""
     extra = {}
 
-    taxes_tile = soup.find(class_="taxes-tile")
+    taxes_tile = tiles.get("taxes-tile")
     if not taxes_tile:
         return extra
 
     tile_text = taxes_tile.get_text()
-    if "не найдена" in tile_text.lower() or "отсутству" in tile_text.lower():
+    tile_text_lower = tile_text.lower()
+    if "не найдена" in tile_text_lower or "отсутству" in tile_text_lower:
         return extra
 
     # Year
-    year_match = re.search(r"за\s+(\d{4})", tile_text)
+    year_match = _RE_YEAR.search(tile_text)
     if year_match:
         extra["taxes_year"] = int(year_match.group(1))
 
     # Method 1: dt/dd structure (smaller companies)
-    for dt in taxes_tile.find_all("dt"):
-        dt_text = dt.get_text(strip=True)
-        dd = dt.find_next_sibling("dd")
-        if not dd:
-            continue
-        dd_text = dd.get_text(strip=True)
-
+    for dt_text, dd_text in _dt_dd_pairs(taxes_tile):
         if "Налог" in dt_text and dd_text:
             extra["taxes_sum"] = dd_text
         elif "Взнос" in dt_text and dd_text:
@@ -531,26 +1010,25 @@ def _parse_taxes(soup) -> dict:
     return extra
 
 
-def _parse_reliability(soup) -> dict:
-    """Extract reliability rating from RPF.store JavaScript and fact counts from HTML."""
-    extra = {}
+_RELIABILITY_RATINGS = {
+    "positive": "ВЫСОКАЯ",
+    "normal": "СРЕДНЯЯ",
+    "negative": "НИЗКАЯ",
+}
 
-    # Rating from JavaScript
-    for script in soup.find_all("script"):
-        script_text = script.string or ""
-        if "check_counterparty" not in script_text:
-            continue
 
-        rel_match = re.search(r"""reliability['"]?\s*:\s*['"](\w+)['"]""", script_text)
-        if rel_match:
-            raw = rel_match.group(1)
-            mapping = {
-                "positive": "ВЫСОКАЯ",
-                "normal": "СРЕДНЯЯ",
-                "negative": "НИЗКАЯ",
-            }
-            extra["reliability_rating"] = mapping.get(raw, raw)
-        break
+def _parse_reliability_rating(html: str) -> dict:
+    """Extract reliability rating from RPF.store JavaScript in the raw page HTML."""
+    rel_match = _RE_RELIABILITY.search(html)
+    if not rel_match:
+        return {}
+    raw = rel_match.group(1)
+    return {"reliability_rating": _RELIABILITY_RATINGS.get(raw, raw)}
+
+
+def _parse_reliability(soup) -> dict:
+    """Extract reliability fact counts from HTML."""
+    extra = {}
 
     # Fact counts from HTML tile (a.count.bg-positive/bg-warning/bg-negative)
     count_map = {
@@ -558,48 +1036,51 @@ def _parse_reliability(soup) -> dict:
         "bg-warning": "reliability_warning",
         "bg-negative": "reliability_negative",
     }
-    for css_suffix, field in count_map.items():
-        el = soup.find("a", class_=lambda c: c and "count" in c and css_suffix in c)
-        if el:
-            text = el.get_text(strip=True)
-            if text.isdigit():
-                extra[field] = int(text)
+    # One pass over a.count links; the first link per colour wins
+    seen = set()
+    for el in soup.select("a.count"):
+        for css_class in el.get("class", ()):
+            field = count_map.get(css_class)
+            if field and field not in seen:
+                seen.add(field)
+                text = el.get_text(strip=True)
+                if text.isdigit():
+                    extra[field] = int(text)
 
     return extra
 
 
-def _parse_sections(soup) -> dict:
-    """Build a sections overview dict from h2 tile headings."""
-    section_tiles = {
-        "arbitr-tile": "arbitration",
-        "trademarks-tile": "trademarks",
-        "gz-tile": "gov_contracts",
-        "inspections-tile": "inspections",
-        "branches-tile": "branches",
-        "licenses-tile": "licenses",
-        "leasing-tile": "leasing",
-        "pledge-tile": "pledges",
-        "facts-tile": "fedresurs",
-        "sou-tile": "courts",
-    }
+_SECTION_TILES = {
+    "arbitr-tile": "arbitration",
+    "trademarks-tile": "trademarks",
+    "gz-tile": "gov_contracts",
+    "inspections-tile": "inspections",
+    "branches-tile": "branches",
+    "licenses-tile": "licenses",
+    "leasing-tile": "leasing",
+    "pledge-tile": "pledges",
+    "facts-tile": "fedresurs",
+    "sou-tile": "courts",
+}
+_NO_DATA_MARKERS = ("не найден", "отсутству", "не обнаружен")
 
-    no_data_markers = ["не найден", "отсутству", "не обнаружен"]
 
+def _parse_sections(tiles: dict) -> dict:
+    """Build a sections overview dict from h2 tile headings."""
     sections = {}
-    for css_class, key in section_tiles.items():
-        tile = soup.find(class_=lambda c: c and css_class in c)
+    for css_class, key in _SECTION_TILES.items():
+        tile = tiles.get(css_class)
         if not tile:
             continue
 
-        text = tile.get_text().lower()
-        has_data = not any(marker in text for marker in no_data_markers)
+        tile_text_raw = tile.get_text()
+        text = tile_text_raw.lower()
+        has_data = not any(marker in text for marker in _NO_DATA_MARKERS)
         entry = {"exists": has_data}
 
         if has_data:
-            tile_text_raw = tile.get_text()
-
             # Try to extract total count from text first (e.g. "34 проверки", "680 дел")
-            total_match = re.search(r"(\d[\d\s]*\d)\s+(?:провер|дел[ао\s]|закуп|лицензи|филиал|товарн|залог|договор)", tile_text_raw)
+            total_match = _RE_SECTION_TOTAL.search(tile_text_raw)
             if total_match:
                 entry["count"] = int(total_match.group(1).replace(" ", ""))
             else:
@@ -611,143 +1092,228 @@ def _parse_sections(soup) -> dict:
                         break
 
             # Try to extract sum for financial sections
-            sum_match = re.search(r"на сумму\s+(.+?руб\.?)", tile_text_raw, re.IGNORECASE)
-            if sum_match:
-                entry["sum"] = sum_match.group(1).strip()
+            if "на сумму" in text:
+                sum_match = _RE_SECTION_SUM.search(tile_text_raw)
+                if sum_match:
+                    entry["sum"] = sum_match.group(1).strip()
 
         sections[key] = entry
 
     return {"sections": sections} if sections else {}
 
 
-def _parse_address_unreliable(soup) -> dict:
+def _parse_address_unreliable(soup, html_lower: str) -> dict:
     """Check if address is flagged as unreliable in the company card (not menu)."""
+    # Cheap raw-HTML guard before touching the tree
+    if "недостоверн" not in html_lower and "unreliable" not in html_lower:
+        return {}
     # Look for specific patterns in the address area or company info section
     # NOT in the counterparty check menu where "Недостоверность адреса" is a label
     for el in soup.find_all(class_="company-info__address"):
         if "недостоверн" in el.get_text().lower():
             return {"address_unreliable": True}
     # Also check for explicit unreliability markers near address
-    for el in soup.find_all(string=re.compile(r"[Сс]ведения об адресе.*недостоверн")):
+    if _RE_ADDRESS_UNRELIABLE_TEXT.search(html_lower):
         return {"address_unreliable": True}
     # Check for a warning/badge near the address
-    for el in soup.find_all(class_=re.compile(r"address.*unreliable|unreliable.*address")):
+    for el in soup.find_all(class_=_RE_ADDRESS_UNRELIABLE_CLASS):
         return {"address_unreliable": True}
     return {}
 
 
-async def parse_company_page(url: str, delay: float = 2.5) -> dict:
-    """Fetch company HTML page and extract all available fields."""
-    await _throttle(delay)
+async def _fetch_html(url: str, delay: float) -> tuple[bytes, str]:
+    """Raw page body and its charset; decoding is left to the parse step."""
+    resp = await _fetch(url, delay)
+    return resp.content, resp.encoding or "utf-8"
+
+
+# Tiles looked up by the _parse_* functions, collected in one traversal
+_PAGE_TILES = frozenset(
+    {"finance-tile", "founders-tile", "fssp-tile", "taxes-tile", *_SECTION_TILES}
+)
+_PAGE_TILES_SELECTOR = ", ".join("." + css_class for css_class in sorted(_PAGE_TILES))
+
+
+def _tile_index(root) -> dict:
+    """Index page tiles by CSS class, first occurrence wins."""
+    index = {}
+    for tile in root.select(_PAGE_TILES_SELECTOR):
+        for css_class in tile.get("class", ()):
+            if css_class in _PAGE_TILES:
+                index.setdefault(css_class, tile)
+    return index
+
+
+def _parse_html(content: bytes, encoding: str, url: str) -> dict:
+    """Run all _parse_* functions over a company page (CPU-bound, sync)."""
     extra: dict = {}
-    try:
-        async with httpx.AsyncClient(timeout=20, follow_redirects=True) as client:
-            resp = await client.get(url, headers=_get_headers())
-            resp.raise_for_status()
-            html = resp.text
-
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Parse all sections
-        parsers = [
-            _parse_basic_fields,
-            _parse_ceo,
-            _parse_msp,
-            _parse_tax_authority,
-            _parse_finances,
-            _parse_founders,
-            _parse_enforcement,
-            _parse_taxes,
-            _parse_reliability,
-            _parse_sections,
-            _parse_address_unreliable,
-        ]
-        for parser_fn in parsers:
-            try:
-                extra.update(parser_fn(soup))
-            except Exception as e:
-                logger.warning("Parser %s failed for %s: %s", parser_fn.__name__, url, e)
+    # The tree builder decodes the bytes itself; the raw-HTML regexes get one
+    # Python-level decode shared by every parser
+    html = content.decode(encoding, errors="replace")
+    html_lower = html.lower()
+    soup = BeautifulSoup(content, _HTML_PARSER, from_encoding=encoding)
+
+    # Page-wide dt, company-row and tile lookups share one index each instead
+    # of rescanning the tree in every parser
+    dt_index = _dt_index(soup)
+    row_index = _row_index(soup)
+    tiles = _tile_index(soup)
+
+    # Parse all sections
+    parsers = [
+        (_parse_basic_fields, (soup, dt_index)),
+        (_parse_ceo, (row_index,)),
+        (_parse_msp, (dt_index, row_index)),
+        (_parse_tax_authority, (soup, dt_index)),
+        (_parse_finances, (tiles,)),
+        (_parse_founders, (tiles,)),
+        (_parse_enforcement, (tiles,)),
+        (_parse_taxes, (tiles,)),
+        (_parse_reliability_rating, (html,)),
+        (_parse_reliability, (soup,)),
+        (_parse_sections, (tiles,)),
+        (_parse_address_unreliable, (soup, html_lower)),
+    ]
+    for parser_fn, args in parsers:
+        try:
+            extra.update(parser_fn(*args))
+        except Exception as e:
+            logger.warning("Parser %s failed for %s: %s", parser_fn.__name__, url, e)
+
+    return extra
 
+
+async def _fetch_and_parse(url: str, delay: float) -> dict:
+    content, encoding = await _fetch_html(url, delay)
+    return await asyncio.to_thread(_parse_html, content, encoding, url)
+
+
+async def parse_company_page(url: str, delay: float = 2.5, force: bool = False) -> dict:
+    """Fetch company HTML page and extract all available fields.
+
+    Parsing runs in a worker thread so it doesn't block the event loop.
+    Parsed fields are memoized per URL for PARSER_CACHE_TTL seconds unless `force`.
+    """
+    try:
+        if force:
+            return await _fetch_and_parse(url, delay)
+        extra = await _page_cache.get_or_call(url, lambda: _fetch_and_parse(url, delay))
+        return dict(extra)
     except Exception as e:
         logger.warning("Failed to parse company page %s: %s", url, e)
+        return {}
+
+
+async def _search_with_prefetch(
+    query: str, delay: float, force: bool
+) -> tuple[_SearchResults, str | None, dict]:
+    """AJAX search, plus the company page in parallel if its URL is already known.
+
+    Returns (results, prefetched page URL or None, prefetched page fields).
+    """
+    known_url = _page_urls.get(query)
+    if not known_url:
+        return await search_ajax(query, delay=delay, force=force), None, {}
+    results, extra = await asyncio.gather(
+        search_ajax(query, delay=delay, force=force),
+        parse_company_page(known_url, delay=delay, force=force),
+    )
+    return results, known_url, extra
 
-    return extra
 
+_COMPANY_FIELDS = frozenset(Company.model_fields)
 
-def _apply_extra(company: Company, extra: dict) -> None:
-    """Apply all extra parsed fields to a Company instance."""
+
+def _apply_extra(company: Company, extra: dict) -> Company:
+    """Return a copy of the (frozen) Company with all extra parsed fields applied."""
+    updates = {}
+    current_values = company.__dict__
     for key, value in extra.items():
-        if value is not None and hasattr(company, key):
+        if value is not None and key in _COMPANY_FIELDS:
             # Don't overwrite non-None values with None, and don't overwrite
             # existing non-empty values unless the new value is also non-empty
-            current = getattr(company, key)
+            current = current_values[key]
             if current is None or (value and key not in ("okpo",)):
-                setattr(company, key, value)
+                updates[key] = value
+    return company.model_copy(update=updates) if updates else company
 
 
-async def get_company_by_inn(inn: str, delay: float = 2.5) -> Company | None:
-    """Full pipeline: AJAX search by INN + HTML page for extra fields."""
-    results = await search_ajax(inn, delay=delay)
+async def _company_with_page(
+    query: str, target: dict, prefetched_url: str | None, prefetched: dict,
+    delay: float, force: bool,
+) -> Company:
+    """Company from a matched AJAX item, enriched with its HTML page fields.
 
-    target = None
-    for item in results:
-        item_inn = _clean_inn(item.get("inn", ""))
-        if item_inn == inn:
-            target = item
-            break
+    Reuses the prefetched page fields when the page URL hasn't changed.
+    """
+    company = _parse_ajax_item(target)
+    if not target.get("url"):
+        return company
 
-    if not target:
-        return None
+    page_url = f"{BASE_URL}{target['url']}"
+    _remember_page_url(query, page_url)
+    if page_url == prefetched_url:
+        extra = prefetched
+    else:
+        extra = await parse_company_page(page_url, delay=delay, force=force)
+    return _apply_extra(company, extra)
 
-    company = _parse_ajax_item(target)
 
-    # Fetch HTML page for extra fields
-    page_url = f"{BASE_URL}{target['url']}" if target.get("url") else None
-    if page_url:
-        extra = await parse_company_page(page_url, delay=delay)
-        _apply_extra(company, extra)
+async def get_company_by_inn(
+    inn: str, delay: float = 2.5, force: bool = False
+) -> Company | None:
+    """Full pipeline: AJAX search by INN + HTML page for extra fields."""
+    results, prefetched_url, prefetched = await _search_with_prefetch(inn, delay, force)
 
-    return company
+    target = results.by_inn().get(inn)
+    if not target:
+        return None
 
+    return await _company_with_page(inn, target, prefetched_url, prefetched, delay, force)
 
-async def get_company_by_ogrn(ogrn: str, delay: float = 2.5) -> Company | None:
-    """Search by OGRN -- same AJAX endpoint, match by OGRN."""
-    results = await search_ajax(ogrn, delay=delay)
 
-    target = None
-    for item in results:
-        if item.get("ogrn") == ogrn or item.get("raw_ogrn") == ogrn:
-            target = item
-            break
+async def get_company_by_ogrn(
+    ogrn: str, delay: float = 2.5, force: bool = False
+) -> Company | None:
+    """Search by OGRN -- same AJAX endpoint, match by OGRN."""
+    results, prefetched_url, prefetched = await _search_with_prefetch(ogrn, delay, force)
 
+    target = results.by_ogrn().get(ogrn)
     if not target:
         return None
 
-    company = _parse_ajax_item(target)
+    return await _company_with_page(ogrn, target, prefetched_url, prefetched, delay, force)
 
-    page_url = f"{BASE_URL}{target['url']}" if target.get("url") else None
-    if page_url:
-        extra = await parse_company_page(page_url, delay=delay)
-        _apply_extra(company, extra)
 
-    return company
+async def get_companies_by_inn(
+    inns: list[str], delay: float = 2.5, concurrency: int = 16
+) -> list[Company | None | BaseException]:
+    """Batch INN lookup: fan out get_company_by_inn concurrently.
+
+    Results keep the order of `inns`; failures are returned as exceptions.
+    All requests still share the client, rate limiter and circuit breaker.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(inn: str) -> Company | None:
+        async with sem:
+            return await get_company_by_inn(inn, delay=delay)
+
+    return await asyncio.gather(*(one(inn) for inn in inns), return_exceptions=True)
 
 
 async def search_companies(query: str, delay: float = 2.5) -> list[SearchResult]:
     """Search by name/query -- returns list of brief results."""
     results = await search_ajax(query, delay=delay)
-
-    out = []
-    for item in results:
-        inn = _clean_inn(item.get("inn", ""))
-        inactive = item.get("inactive", 0)
-        out.append(SearchResult(
-            inn=inn,
+    return [
+        SearchResult(
+            inn=_clean_inn(item.get("inn", "")),
             name=item.get("raw_name") or item.get("name"),
             ogrn=item.get("ogrn"),
             address=item.get("address"),
             ceo_name=item.get("ceo_name"),
-            status="Ликвидирована" if inactive else "Действующая",
+            status=_STATUS_LIQUIDATED if item.get("inactive", 0) else _STATUS_ACTIVE,
             url=f"{BASE_URL}{item['url']}" if item.get("url") else None,
-        ))
-    return out
+        )
+        for item in results
+    ]